@@ -1,6 +1,6 @@
-import asyncio
 from typing import Any, Optional
 
+from .core.async_utils import run_sync
 from .core.resinkit_api_client import ResinkitAPIClient
 from .core.settings import get_settings, update_settings
 from .core.task import Task
@@ -55,18 +55,7 @@ def __call__(query: str) -> Any:
     Usage: rsk("What were the total sales for each product category?")
     """
     agent_manager = _get_agent_manager()
-
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            import nest_asyncio
-
-            nest_asyncio.apply()
-            return loop.run_until_complete(agent_manager.run_workflow(query))
-        else:
-            return loop.run_until_complete(agent_manager.run_workflow(query))
-    except RuntimeError:
-        return asyncio.run(agent_manager.run_workflow(query))
+    return run_sync(agent_manager.run_workflow(query))
 
 
 def show_tasks_ui():
@@ -6,14 +6,16 @@ LLM models, and MCP server connections for various AI agents.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
 from pydantic_ai import Agent
-from pydantic_ai.mcp import ProcessToolCallback
 
 from resinkit.ai.utils import LLMManager, MCPManager
 from resinkit.core.settings import AgentsConfig, get_settings
 
+if TYPE_CHECKING:
+    from pydantic_ai.mcp import ProcessToolCallback
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +34,7 @@ class AgentManager:
         config: Optional[AgentsConfig] = None,
         llm_manager: Optional[LLMManager] = None,
         mcp_manager: Optional[MCPManager] = None,
-        global_process_tool_call: Optional[ProcessToolCallback] = None,
+        global_process_tool_call: Optional["ProcessToolCallback"] = None,
     ):
         """
         Initialize the Agent Manager.
@@ -43,13 +45,14 @@ class AgentManager:
             mcp_manager: Pre-configured MCP manager. Creates new one if None.
             global_process_tool_call: Global tool call processor for all agents
         """
-        self.config = config or get_settings().agents_config
+        settings = get_settings()
+        self.config = config or settings.agents_config
         self.global_process_tool_call = global_process_tool_call
 
-        # Initialize managers
-        self.llm_manager = llm_manager or LLMManager()
+        # Initialize managers from the same settings instance
+        self.llm_manager = llm_manager or LLMManager(settings.llm_config)
         self.mcp_manager = mcp_manager or MCPManager(
-            process_tool_call=global_process_tool_call
+            settings.mcp_manager_config, process_tool_call=global_process_tool_call
         )
 
         # Agent instances cache
@@ -124,12 +127,12 @@ class AgentManager:
         """Get the LLM manager instance."""
         return self.llm_manager
 
-    def get_available_mcp_tools(self) -> Dict[str, List[Any]]:
+    def get_available_mcp_tools(self) -> Mapping[str, List[Any]]:
         """
         Get all available MCP tools from connected servers.
 
         Returns:
-            Dict[str, List[Any]]: Map of server names to their available tools
+            Mapping[str, List[Any]]: Map of server names to their available tools
         """
         return self.mcp_manager.get_all_tools()
 
@@ -5,23 +5,90 @@ This module provides an LLMManager class that creates and manages pydantic-ai mo
 based on the configuration from resinkit.core.settings.
 """
 
+import functools
+import hashlib
 import logging
 import os
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 from pydantic_ai.models import Model
-from pydantic_ai.models.anthropic import AnthropicModel
-from pydantic_ai.models.google import GoogleModel
-from pydantic_ai.models.openai import OpenAIModel
-from pydantic_ai.providers.anthropic import AnthropicProvider
-from pydantic_ai.providers.google import GoogleProvider
-from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
 from resinkit.core.settings import LLMConfig, get_settings
 
+if TYPE_CHECKING:
+    # Each backend pulls in its vendor SDK; they are imported on first model creation
+    from pydantic_ai.models.anthropic import AnthropicModel
+    from pydantic_ai.models.google import GoogleModel
+    from pydantic_ai.models.openai import OpenAIModel
+
 logger = logging.getLogger(__name__)
 
+# Supported LLM providers
+_PROVIDERS = ("openai", "anthropic", "google")
+
+# Environment variables checked (in order) for each provider's API key
+_API_KEY_ENV_VARS: Dict[str, Tuple[str, ...]] = {
+    "openai": ("OPENAI_API_KEY",),
+    "anthropic": ("ANTHROPIC_API_KEY",),
+    "google": ("GOOGLE_API_KEY", "GEMINI_API_KEY"),
+}
+
+# Resolved API keys; misses are not cached so keys exported later are still picked up
+_api_key_cache: Dict[str, str] = {}
+
+
+def _resolve_api_key(provider: str) -> Optional[str]:
+    """Resolve a provider's API key from the environment, caching it once found."""
+    api_key = _api_key_cache.get(provider)
+    if api_key is None:
+        for env_var in _API_KEY_ENV_VARS[provider]:
+            if api_key := os.getenv(env_var):
+                _api_key_cache[provider] = api_key
+                break
+    return api_key or None
+
+
+def clear_env_cache() -> None:
+    """Forget API keys resolved from the environment."""
+    _api_key_cache.clear()
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_provider(provider_cls: type, api_key: str, **kwargs) -> Any:
+    """Construct a provider once per (class, api_key, kwargs) so its SDK client is shared."""
+    return provider_cls(api_key=api_key, **kwargs)
+
+
+def _get_provider(provider_cls: type, api_key: str, **kwargs) -> Any:
+    """Get a shared provider instance, falling back to a fresh one for unhashable kwargs."""
+    try:
+        hash(tuple(kwargs.values()))
+    except TypeError:
+        # lru_cache cannot key on unhashable arguments (e.g. dicts)
+        return provider_cls(api_key=api_key, **kwargs)
+    return _cached_provider(provider_cls, api_key, **kwargs)
+
+
+def _api_key_fingerprint(api_key: Optional[str]) -> Optional[str]:
+    """Identify an explicit API key in cache keys without storing the key itself."""
+    if api_key is None:
+        return None
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+def _kwargs_key(kwargs: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Build a hashable cache key from kwargs, using repr only for unhashable values."""
+    items = []
+    for key, value in sorted(kwargs.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        items.append((key, value))
+    return tuple(items)
+
 
 class LLMManager:
     """
@@ -31,6 +98,8 @@ class LLMManager:
     based on the LLM configuration from resinkit settings.
     """
 
+    __slots__ = ("llm_config", "_cached_models", "_cache_max", "_creators")
+
     def __init__(self, llm_config: Optional[LLMConfig] = None):
         """
         Initialize the LLM Manager.
@@ -39,7 +108,14 @@ class LLMManager:
             llm_config: Optional LLM configuration. If None, uses settings from get_settings()
         """
         self.llm_config = llm_config or get_settings().llm_config
-        self._cached_models: Dict[str, Any] = {}
+        # Least recently used models are evicted once the cache is full
+        self._cached_models: "OrderedDict[Tuple[Any, ...], Model]" = OrderedDict()
+        self._cache_max = 64
+        self._creators: Dict[str, Callable[..., Model]] = {
+            "openai": self._create_openai_model,
+            "anthropic": self._create_anthropic_model,
+            "google": self._create_google_model,
+        }
 
     def get_model(
         self,
@@ -78,33 +154,34 @@ class LLMManager:
             max_tokens if max_tokens is not None else self.llm_config.max_tokens
         )
 
+        provider_key = provider.lower()
+
         # Create cache key
         cache_key = (
-            f"{provider}:{model_name}:{temperature}:{max_tokens}:{hash(str(kwargs))}"
+            provider_key,
+            model_name,
+            temperature,
+            max_tokens,
+            _api_key_fingerprint(api_key),
+            _kwargs_key(kwargs),
         )
 
         # Return cached model if available
-        if cache_key in self._cached_models:
-            return self._cached_models[cache_key]
+        model = self._cached_models.get(cache_key)
+        if model is not None:
+            self._cached_models.move_to_end(cache_key)
+            return model
 
         # Create model based on provider
-        if provider.lower() == "openai":
-            model = self._create_openai_model(
-                model_name, temperature, max_tokens, api_key, **kwargs
-            )
-        elif provider.lower() == "anthropic":
-            model = self._create_anthropic_model(
-                model_name, temperature, max_tokens, api_key, **kwargs
-            )
-        elif provider.lower() == "google":
-            model = self._create_google_model(
-                model_name, temperature, max_tokens, api_key, **kwargs
-            )
-        else:
+        creator = self._creators.get(provider_key)
+        if creator is None:
             raise ValueError(f"Unsupported LLM provider: {provider}")
+        model = creator(model_name, temperature, max_tokens, api_key, **kwargs)
 
         # Cache and return model
         self._cached_models[cache_key] = model
+        if len(self._cached_models) > self._cache_max:
+            self._cached_models.popitem(last=False)
         logger.debug(f"Created {provider} model: {model_name}")
 
         return model
@@ -116,19 +193,21 @@ class LLMManager:
         max_tokens: int,
         api_key: Optional[str],
         **kwargs,
-    ) -> OpenAIModel:
+    ) -> "OpenAIModel":
         """Create an OpenAI model instance."""
+        from pydantic_ai.models.openai import OpenAIModel
+        from pydantic_ai.providers.openai import OpenAIProvider
+
         # Auto-detect API key if not provided
         if api_key is None:
-            api_key = os.getenv("OPENAI_API_KEY")
+            api_key = _resolve_api_key("openai")
             if not api_key:
                 raise ValueError(
                     "OpenAI API key not provided and OPENAI_API_KEY environment variable not set"
                 )
 
-        # Create provider with configuration
-        provider_kwargs = {"api_key": api_key, **kwargs}
-        provider = OpenAIProvider(**provider_kwargs)
+        # Reuse the provider (and its SDK client) across managers
+        provider = _get_provider(OpenAIProvider, api_key, **kwargs)
 
         # Create model settings
         settings = ModelSettings(temperature=temperature, max_tokens=max_tokens)
@@ -143,19 +222,21 @@ class LLMManager:
         max_tokens: int,
         api_key: Optional[str],
         **kwargs,
-    ) -> AnthropicModel:
+    ) -> "AnthropicModel":
         """Create an Anthropic model instance."""
+        from pydantic_ai.models.anthropic import AnthropicModel
+        from pydantic_ai.providers.anthropic import AnthropicProvider
+
         # Auto-detect API key if not provided
         if api_key is None:
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+            api_key = _resolve_api_key("anthropic")
             if not api_key:
                 raise ValueError(
                     "Anthropic API key not provided and ANTHROPIC_API_KEY environment variable not set"
                 )
 
-        # Create provider with configuration
-        provider_kwargs = {"api_key": api_key, **kwargs}
-        provider = AnthropicProvider(**provider_kwargs)
+        # Reuse the provider (and its SDK client) across managers
+        provider = _get_provider(AnthropicProvider, api_key, **kwargs)
 
         # Create model settings
         settings = ModelSettings(temperature=temperature, max_tokens=max_tokens)
@@ -170,19 +251,21 @@ class LLMManager:
         max_tokens: int,
         api_key: Optional[str],
         **kwargs,
-    ) -> GoogleModel:
+    ) -> "GoogleModel":
         """Create a Google model instance."""
+        from pydantic_ai.models.google import GoogleModel
+        from pydantic_ai.providers.google import GoogleProvider
+
         # Auto-detect API key if not provided
         if api_key is None:
-            api_key = os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY")
+            api_key = _resolve_api_key("google")
             if not api_key:
                 raise ValueError(
                     "Google API key not provided and GOOGLE_API_KEY/GEMINI_API_KEY environment variable not set"
                 )
 
-        # Create provider with configuration
-        provider_kwargs = {"api_key": api_key, **kwargs}
-        provider = GoogleProvider(**provider_kwargs)
+        # Reuse the provider (and its SDK client) across managers
+        provider = _get_provider(GoogleProvider, api_key, **kwargs)
 
         # Create model settings
         settings = ModelSettings(temperature=temperature, max_tokens=max_tokens)
@@ -197,7 +280,7 @@ class LLMManager:
         max_tokens: Optional[int] = None,
         api_key: Optional[str] = None,
         **kwargs,
-    ) -> OpenAIModel:
+    ) -> "OpenAIModel":
         """
         Get an OpenAI model instance.
 
@@ -227,7 +310,7 @@ class LLMManager:
         max_tokens: Optional[int] = None,
         api_key: Optional[str] = None,
         **kwargs,
-    ) -> AnthropicModel:
+    ) -> "AnthropicModel":
         """
         Get an Anthropic model instance.
 
@@ -257,7 +340,7 @@ class LLMManager:
         max_tokens: Optional[int] = None,
         api_key: Optional[str] = None,
         **kwargs,
-    ) -> GoogleModel:
+    ) -> "GoogleModel":
         """
         Get a Google model instance.
 
@@ -303,7 +386,7 @@ class LLMManager:
         Returns:
             list[str]: List of supported provider names
         """
-        return ["openai", "anthropic", "google"]
+        return list(_PROVIDERS)
 
     def get_config_summary(self) -> Dict[str, Any]:
         """
@@ -322,6 +405,24 @@ class LLMManager:
         }
 
 
+_default_manager: Optional[LLMManager] = None
+
+
+def _get_default_manager() -> LLMManager:
+    global _default_manager
+    llm_config = get_settings().llm_config
+    # Rebuild when update_settings()/reset_settings() swapped the LLM config out
+    if _default_manager is None or _default_manager.llm_config is not llm_config:
+        _default_manager = LLMManager(llm_config)
+    return _default_manager
+
+
+def reset_default_manager() -> None:
+    """Reset the shared LLMManager used by the convenience functions."""
+    global _default_manager
+    _default_manager = None
+
+
 # Convenience functions for quick access
 def get_default_model(
     provider: Optional[str] = None, model_name: Optional[str] = None, **kwargs
@@ -337,23 +438,21 @@ def get_default_model(
     Returns:
         Model: Configured pydantic-ai model instance
     """
-    manager = LLMManager()
-    return manager.get_model(provider=provider, model_name=model_name, **kwargs)
+    return _get_default_manager().get_model(
+        provider=provider, model_name=model_name, **kwargs
+    )
 
 
-def get_openai_model(**kwargs) -> OpenAIModel:
+def get_openai_model(**kwargs) -> "OpenAIModel":
     """Get an OpenAI model with default configuration."""
-    manager = LLMManager()
-    return manager.get_openai_model(**kwargs)
+    return _get_default_manager().get_openai_model(**kwargs)
 
 
-def get_anthropic_model(**kwargs) -> AnthropicModel:
+def get_anthropic_model(**kwargs) -> "AnthropicModel":
     """Get an Anthropic model with default configuration."""
-    manager = LLMManager()
-    return manager.get_anthropic_model(**kwargs)
+    return _get_default_manager().get_anthropic_model(**kwargs)
 
 
-def get_google_model(**kwargs) -> GoogleModel:
+def get_google_model(**kwargs) -> "GoogleModel":
     """Get a Google model with default configuration."""
-    manager = LLMManager()
-    return manager.get_google_model(**kwargs)
+    return _get_default_manager().get_google_model(**kwargs)
@@ -7,16 +7,18 @@ server connections and toolsets across different transport types.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Union
-
-from pydantic_ai.mcp import (
-    MCPServerSSE,
-    MCPServerStdio,
-    MCPServerStreamableHTTP,
-    ProcessToolCallback,
-    ToolDefinition,
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
 )
-from pydantic_ai.models import Model
 
 from resinkit.core.settings import (
     MCPConfig,
@@ -27,10 +29,59 @@ from resinkit.core.settings import (
     get_settings,
 )
 
+if TYPE_CHECKING:
+    # pydantic_ai.mcp pulls in the mcp SDK; it is imported on first server creation
+    from pydantic_ai.mcp import (
+        MCPServerSSE,
+        MCPServerStdio,
+        MCPServerStreamableHTTP,
+        ProcessToolCallback,
+        ToolDefinition,
+    )
+    from pydantic_ai.models import Model
+
 logger = logging.getLogger(__name__)
 
 # Type alias for MCP server instances
-MCPServerInstance = Union[MCPServerStreamableHTTP, MCPServerSSE, MCPServerStdio]
+MCPServerInstance = Union["MCPServerStreamableHTTP", "MCPServerSSE", "MCPServerStdio"]
+
+
+def _make_streamable_http(
+    config: MCPStreamableHTTPConfig, common_params: Dict[str, Any]
+) -> "MCPServerStreamableHTTP":
+    from pydantic_ai.mcp import MCPServerStreamableHTTP
+
+    return MCPServerStreamableHTTP(
+        url=config.url,
+        headers=config.headers,
+        sse_read_timeout=config.sse_read_timeout,
+        **common_params,
+    )
+
+
+def _make_sse(config: MCPSSEConfig, common_params: Dict[str, Any]) -> "MCPServerSSE":
+    from pydantic_ai.mcp import MCPServerSSE
+
+    return MCPServerSSE(
+        url=config.url,
+        headers=config.headers,
+        sse_read_timeout=config.sse_read_timeout,
+        **common_params,
+    )
+
+
+def _make_stdio(
+    config: MCPStdioConfig, common_params: Dict[str, Any]
+) -> "MCPServerStdio":
+    from pydantic_ai.mcp import MCPServerStdio
+
+    return MCPServerStdio(
+        command=config.command,
+        args=config.args,
+        env=config.env,
+        cwd=config.cwd,
+        **common_params,
+    )
 
 
 class MCPManager:
@@ -43,11 +94,29 @@ class MCPManager:
     - stdio Server
     """
 
+    __slots__ = (
+        "config",
+        "global_process_tool_call",
+        "global_sampling_model",
+        "_servers",
+        "_server_tools",
+        "_server_tools_view",
+        "_locks",
+        "_server_instance_cache",
+    )
+
+    # Server factory for each transport config type
+    _FACTORY: Dict[type, Callable[[Any, Dict[str, Any]], MCPServerInstance]] = {
+        MCPStreamableHTTPConfig: _make_streamable_http,
+        MCPSSEConfig: _make_sse,
+        MCPStdioConfig: _make_stdio,
+    }
+
     def __init__(
         self,
         config: Optional[MCPManagerConfig] = None,
-        process_tool_call: Optional[ProcessToolCallback] = None,
-        sampling_model: Optional[Model] = None,
+        process_tool_call: Optional["ProcessToolCallback"] = None,
+        sampling_model: Optional["Model"] = None,
     ):
         """
         Initialize the MCP Manager.
@@ -61,11 +130,17 @@ class MCPManager:
         self.global_process_tool_call = process_tool_call
         self.global_sampling_model = sampling_model
 
-        # Server instances and connection state
+        # Server instances and connection state; a server is connected while it is
+        # in _servers
         self._servers: Dict[str, MCPServerInstance] = {}
-        self._connected_servers: Dict[str, bool] = {}
-        self._server_tools: Dict[str, List[ToolDefinition]] = {}
-        self._connection_lock = asyncio.Lock()
+        self._server_tools: Dict[str, List["ToolDefinition"]] = {}
+        self._server_tools_view = MappingProxyType(self._server_tools)
+        # Per-server locks, so operations on different servers do not queue up
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # Server instances are reusable across reconnects, so keep the last one built
+        # for each server name together with the config it was built from
+        self._server_instance_cache: Dict[str, Tuple[MCPConfig, MCPServerInstance]] = {}
 
     async def connect_server(
         self, server_name: str, config: Optional[MCPConfig] = None
@@ -84,92 +159,121 @@ class MCPManager:
             ValueError: If server configuration not found
             ConnectionError: If connection fails
         """
-        async with self._connection_lock:
-            # Use provided config or get from manager config
-            if config is None:
-                if server_name not in self.config.servers:
-                    raise ValueError(
-                        f"Server '{server_name}' not found in configuration"
-                    )
-                config = self.config.servers[server_name]
-
-            # Create server instance based on transport type
-            server = self._create_server_instance(config)
-
-            try:
-                # Test connection by entering context
-                await server.__aenter__()
-
-                # Store server and mark as connected
-                self._servers[server_name] = server
-                self._connected_servers[server_name] = True
-
-                # Load tools from server
-                try:
-                    tools = await server.list_tools()
-                    self._server_tools[server_name] = tools
-                    logger.info(
-                        f"Connected to MCP server '{server_name}' with {len(tools)} tools"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Connected to server '{server_name}' but failed to list tools: {e}"
-                    )
-                    self._server_tools[server_name] = []
-
-                return server
-
-            except Exception as e:
-                logger.error(f"Failed to connect to MCP server '{server_name}': {e}")
-                raise ConnectionError(
-                    f"Could not connect to MCP server '{server_name}': {e}"
-                )
+        # Already connected: reuse the live connection instead of opening another
+        existing = self._servers.get(server_name)
+        if existing is not None:
+            return existing
+
+        async with self._lock_for(server_name):
+            # Re-check: a concurrent connect may have finished while we waited
+            existing = self._servers.get(server_name)
+            if existing is not None:
+                return existing
+
+            server = await self._enter_server(server_name, config)
+            tools = await self._list_server_tools(server_name, server)
+            return await self._register_server(server_name, server, tools)
+
+    def _lock_for(self, server_name: str) -> asyncio.Lock:
+        """Get the lock guarding connection changes for a server."""
+        return self._locks.setdefault(server_name, asyncio.Lock())
+
+    async def _enter_server(
+        self, server_name: str, config: Optional[MCPConfig] = None
+    ) -> MCPServerInstance:
+        """Create a server instance and open its connection."""
+        # Use provided config or get from manager config
+        if config is None:
+            if server_name not in self.config.servers:
+                raise ValueError(f"Server '{server_name}' not found in configuration")
+            config = self.config.servers[server_name]
 
-    def _create_server_instance(self, config: MCPConfig) -> MCPServerInstance:
-        """Create an MCP server instance based on configuration."""
+        # Create server instance based on transport type
+        server = self._create_server_instance(server_name, config)
 
-        # Common parameters for all server types
-        common_params = {
-            "tool_prefix": config.tool_prefix,
-            "log_level": config.log_level,
-            "timeout": config.timeout,
-            "process_tool_call": self.global_process_tool_call,
-            "allow_sampling": config.allow_sampling,
-            "max_retries": config.max_retries,
-            "sampling_model": self.global_sampling_model,
-        }
+        try:
+            # Test connection by entering context
+            await server.__aenter__()
+        except Exception as e:
+            logger.error(f"Failed to connect to MCP server '{server_name}': {e}")
+            raise ConnectionError(
+                f"Could not connect to MCP server '{server_name}': {e}"
+            )
 
-        # Remove None values
-        common_params = {k: v for k, v in common_params.items() if v is not None}
+        return server
 
-        if isinstance(config, MCPStreamableHTTPConfig):
-            return MCPServerStreamableHTTP(
-                url=config.url,
-                headers=config.headers,
-                sse_read_timeout=config.sse_read_timeout,
-                **common_params,
+    async def _list_server_tools(
+        self, server_name: str, server: MCPServerInstance
+    ) -> List["ToolDefinition"]:
+        """Load tools from a connected server, falling back to none on failure."""
+        try:
+            tools = await server.list_tools()
+            logger.info(
+                f"Connected to MCP server '{server_name}' with {len(tools)} tools"
             )
-
-        elif isinstance(config, MCPSSEConfig):
-            return MCPServerSSE(
-                url=config.url,
-                headers=config.headers,
-                sse_read_timeout=config.sse_read_timeout,
-                **common_params,
+            return tools
+        except Exception as e:
+            logger.warning(
+                f"Connected to server '{server_name}' but failed to list tools: {e}"
             )
+            return []
 
-        elif isinstance(config, MCPStdioConfig):
-            return MCPServerStdio(
-                command=config.command,
-                args=config.args,
-                env=config.env,
-                cwd=config.cwd,
-                **common_params,
-            )
+    async def _register_server(
+        self,
+        server_name: str,
+        server: MCPServerInstance,
+        tools: List["ToolDefinition"],
+    ) -> MCPServerInstance:
+        """
+        Record a connected server and its tools.
+
+        If a concurrent connect registered the name first, the connection just
+        opened is released and the registered server is returned instead.
+        """
+        # No await between the check and the updates, so this is atomic on the loop
+        existing = self._servers.get(server_name)
+        if existing is None:
+            self._servers[server_name] = server
+            self._server_tools[server_name] = tools
+            return server
 
-        else:
+        await server.__aexit__(None, None, None)
+        return existing
+
+    def _create_server_instance(
+        self, server_name: str, config: MCPConfig
+    ) -> MCPServerInstance:
+        """Create an MCP server instance based on configuration."""
+        cached = self._server_instance_cache.get(server_name)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+
+        # A new config replaces the server's previous instance
+        server = self._build_server_instance(config)
+        self._server_instance_cache[server_name] = (config, server)
+        return server
+
+    def _build_server_instance(self, config: MCPConfig) -> MCPServerInstance:
+        factory = self._FACTORY.get(type(config))
+        if factory is None:
             raise ValueError(f"Unsupported MCP config type: {type(config)}")
 
+        # Common parameters for all server types, without the unset (None) ones
+        common_params: Dict[str, Any] = {}
+        for key, value in (
+            ("tool_prefix", config.tool_prefix),
+            ("log_level", config.log_level),
+            ("timeout", config.timeout),
+            ("process_tool_call", self.global_process_tool_call),
+            ("allow_sampling", config.allow_sampling),
+            ("max_retries", config.max_retries),
+            ("sampling_model", self.global_sampling_model),
+        ):
+            if value is not None:
+                common_params[key] = value
+
+        return factory(config, common_params)
+
     async def connect_all(self) -> Dict[str, bool]:
         """
         Connect to all configured servers.
@@ -178,15 +282,31 @@ class MCPManager:
             Dict[str, bool]: Map of server names to connection success status
         """
         results = {}
+        entered = {}
 
+        # Connections are opened one at a time: each server's transport is bound to
+        # the task that entered it, so __aenter__ cannot be fanned out with gather
         for server_name in self.config.servers:
+            if server_name in self._servers:
+                results[server_name] = True
+                continue
             try:
-                await self.connect_server(server_name)
+                entered[server_name] = await self._enter_server(server_name)
                 results[server_name] = True
             except Exception as e:
                 logger.error(f"Failed to connect to server '{server_name}': {e}")
                 results[server_name] = False
 
+        # Tool listing goes over the established sessions and can run concurrently
+        server_tools = await asyncio.gather(
+            *(
+                self._list_server_tools(server_name, server)
+                for server_name, server in entered.items()
+            )
+        )
+        for (server_name, server), tools in zip(entered.items(), server_tools):
+            await self._register_server(server_name, server, tools)
+
         return results
 
     async def disconnect_server(self, server_name: str) -> None:
@@ -196,27 +316,25 @@ class MCPManager:
         Args:
             server_name: Name of the server to disconnect
         """
-        async with self._connection_lock:
-            if server_name in self._servers:
-                server = self._servers[server_name]
-                try:
-                    await server.__aexit__(None, None, None)
-                except Exception as e:
-                    logger.warning(
-                        f"Error disconnecting from server '{server_name}': {e}"
-                    )
+        async with self._lock_for(server_name):
+            server = self._servers.pop(server_name, None)
+            if server is None:
+                return
+            self._server_tools.pop(server_name, None)
 
-                del self._servers[server_name]
-                self._connected_servers[server_name] = False
-                if server_name in self._server_tools:
-                    del self._server_tools[server_name]
+            try:
+                await server.__aexit__(None, None, None)
+            except Exception as e:
+                logger.warning(f"Error disconnecting from server '{server_name}': {e}")
 
-                logger.info(f"Disconnected from MCP server '{server_name}'")
+            logger.info(f"Disconnected from MCP server '{server_name}'")
 
     async def disconnect_all(self) -> None:
         """Disconnect from all connected servers."""
+        # Close in reverse connection order: the transports nest their task-group
+        # scopes, so they cannot be exited concurrently or out of order
         server_names = list(self._servers.keys())
-        for server_name in server_names:
+        for server_name in reversed(server_names):
             await self.disconnect_server(server_name)
 
     def get_server(self, server_name: str) -> Optional[MCPServerInstance]:
@@ -238,11 +356,9 @@ class MCPManager:
         Returns:
             List[str]: Names of connected servers
         """
-        return [
-            name for name, connected in self._connected_servers.items() if connected
-        ]
+        return list(self._servers)
 
-    def get_server_tools(self, server_name: str) -> List[ToolDefinition]:
+    def get_server_tools(self, server_name: str) -> List["ToolDefinition"]:
         """
         Get tools available from a specific server.
 
@@ -254,14 +370,15 @@ class MCPManager:
         """
         return self._server_tools.get(server_name, [])
 
-    def get_all_tools(self) -> Dict[str, List[ToolDefinition]]:
+    def get_all_tools(self) -> Mapping[str, List["ToolDefinition"]]:
         """
         Get all tools from all connected servers.
 
         Returns:
-            Dict[str, List[ToolDefinition]]: Map of server names to their tools
+            Mapping[str, List[ToolDefinition]]: Read-only live view of server names
+                to their tools; copy it with dict() to keep a snapshot
         """
-        return dict(self._server_tools)
+        return self._server_tools_view
 
     def get_toolsets(self) -> List[MCPServerInstance]:
         """
@@ -272,7 +389,7 @@ class MCPManager:
         """
         return list(self._servers.values())
 
-    async def list_tools_from_server(self, server_name: str) -> List[ToolDefinition]:
+    async def list_tools_from_server(self, server_name: str) -> List["ToolDefinition"]:
         """
         Refresh and get tools from a specific server.
 
@@ -285,17 +402,19 @@ class MCPManager:
         Raises:
             ValueError: If server not connected
         """
-        if server_name not in self._servers:
-            raise ValueError(f"Server '{server_name}' is not connected")
+        async with self._lock_for(server_name):
+            # Checked under the lock, so a disconnect cannot slip in before listing
+            server = self._servers.get(server_name)
+            if server is None:
+                raise ValueError(f"Server '{server_name}' is not connected")
 
-        server = self._servers[server_name]
-        try:
-            tools = await server.list_tools()
-            self._server_tools[server_name] = tools
-            return tools
-        except Exception as e:
-            logger.error(f"Failed to list tools from server '{server_name}': {e}")
-            raise
+            try:
+                tools = await server.list_tools()
+                self._server_tools[server_name] = tools
+                return tools
+            except Exception as e:
+                logger.error(f"Failed to list tools from server '{server_name}': {e}")
+                raise
 
     async def call_tool(self, server_name: str, tool_name: str, **kwargs) -> Any:
         """
@@ -335,7 +454,7 @@ class MCPManager:
         Returns:
             bool: True if connected, False otherwise
         """
-        return self._connected_servers.get(server_name, False)
+        return server_name in self._servers
 
     def get_connection_status(self) -> Dict[str, bool]:
         """
@@ -344,10 +463,7 @@ class MCPManager:
         Returns:
             Dict[str, bool]: Map of server names to connection status
         """
-        status = {}
-        for server_name in self.config.servers:
-            status[server_name] = self.is_connected(server_name)
-        return status
+        return {name: name in self._servers for name in self.config.servers}
 
     def get_manager_summary(self) -> Dict[str, Any]:
         """
@@ -358,9 +474,7 @@ class MCPManager:
         """
         return {
             "configured_servers": len(self.config.servers),
-            "connected_servers": len(
-                [s for s in self._connected_servers.values() if s]
-            ),
+            "connected_servers": len(self._servers),
             "total_tools": sum(len(tools) for tools in self._server_tools.values()),
             "connection_status": self.get_connection_status(),
             "server_tools": {
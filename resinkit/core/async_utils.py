@@ -0,0 +1,102 @@
+"""
+Helpers for driving coroutines from synchronous code.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Coroutine, Iterable, List, TypeVar
+
+T = TypeVar("T")
+
+# nest_asyncio patches the running loop in place, so it only needs to be applied once
+_nest_asyncio_applied = False
+
+
+def _apply_nest_asyncio() -> bool:
+    """Apply nest_asyncio once per process. Returns False if it is not installed."""
+    global _nest_asyncio_applied
+    if not _nest_asyncio_applied:
+        try:
+            import nest_asyncio
+        except ImportError:
+            return False
+
+        nest_asyncio.apply()
+        _nest_asyncio_applied = True
+    return True
+
+
+def _run_in_thread(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on a fresh event loop in a worker thread."""
+    result = []
+    exception = []
+
+    def run():
+        try:
+            result.append(asyncio.run(coro))
+        except BaseException as e:
+            exception.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    if exception:
+        raise exception[0]
+    return result[0]
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run() when no event loop is running. Inside a running loop
+    (e.g. Jupyter), re-enters the current loop via nest_asyncio, falling back
+    to a worker thread when nest_asyncio is not installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop running, use asyncio.run
+        return asyncio.run(coro)
+
+    if _apply_nest_asyncio():
+        return loop.run_until_complete(coro)
+    return _run_in_thread(coro)
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[T]], limit: int, return_exceptions: bool = False
+) -> List[T]:
+    """
+    Like asyncio.gather(), but with at most ``limit`` awaitables running at once.
+
+    Args:
+        aws: Awaitables to run
+        limit: Maximum number in flight
+        return_exceptions: Return exceptions as results instead of raising the first
+
+    Returns:
+        Results in the order of ``aws``
+
+    Raises:
+        ValueError: If ``limit`` is less than 1
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(run(aw) for aw in aws), return_exceptions=return_exceptions
+    )
@@ -3,7 +3,10 @@ ResInKit API Client for interacting with the ResInKit REST API.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+import httpx
 
 from resinkit_api_client import AuthenticatedClient, Client
 from resinkit_api_client.api.db_crawl import crawl_database_tables
@@ -57,8 +60,23 @@ from resinkit_api_client.models.task_result import TaskResult
 from resinkit_api_client.models.variable_create import VariableCreate
 from resinkit_api_client.models.variable_response import VariableResponse
 
+from .async_utils import gather_bounded
 from .settings import get_settings
 
+# Connection pool limits for the httpx client shared by all calls of one API client
+DEFAULT_HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+
+ModelT = TypeVar("ModelT")
+
+
+def _as_model(model_cls: Type[ModelT], data: Union[Dict[str, Any], ModelT]) -> ModelT:
+    """Use a request model as is, or build it from a plain dict."""
+    if isinstance(data, model_cls):
+        return data
+    return model_cls.from_dict(data)
+
 
 class ResinkitAPIClient:
     """
@@ -70,6 +88,10 @@ class ResinkitAPIClient:
         base_url: Optional[str] = None,
         access_token: Optional[str] = None,
         session_id: Optional[str] = None,
+        sql_sources_cache_ttl: float = 0.0,
+        httpx_client: Optional[httpx.AsyncClient] = None,
+        max_concurrent_requests: int = 8,
+        http2: Optional[bool] = None,
     ):
         """
         Initialize the API client.
@@ -78,104 +100,194 @@ class ResinkitAPIClient:
             base_url: Base URL for the API (defaults to settings)
             access_token: Access token for authentication (defaults to settings)
             session_id: Session ID for cookie-based authentication (defaults to settings)
+            sql_sources_cache_ttl: Seconds to reuse the result of list_sql_sources (0, the default, disables caching)
+            httpx_client: Pre-configured httpx.AsyncClient to share (must carry base_url and auth)
+            max_concurrent_requests: Requests in flight at once for the get_many_* helpers
+            http2: Use HTTP/2 for API calls (defaults to settings; needs httpx[http2])
+
+        Raises:
+            ValueError: If max_concurrent_requests is less than 1
         """
+        if max_concurrent_requests < 1:
+            raise ValueError(
+                f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}"
+            )
+
         settings = get_settings()
 
         self.base_url = base_url or settings.resinkit.base_url
         self.access_token = access_token or settings.resinkit.access_token
         self.session_id = session_id or settings.resinkit.session_id
+        self.sql_sources_cache_ttl = sql_sources_cache_ttl
+        self.max_concurrent_requests = max_concurrent_requests
+        self.http2 = settings.resinkit.http2 if http2 is None else http2
 
         self._client = self._create_client()
+        # A caller-supplied httpx client is shared and stays the caller's to manage
+        self._owns_httpx_client = httpx_client is None
+        if httpx_client is not None:
+            self._client.set_async_httpx_client(httpx_client)
+        # Event loop the pooled connections were opened on (see _get_client)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sql_sources_cache: Optional[Tuple[float, List[SqlSourceResponse]]] = None
+        # Bumped on every invalidation so a list fetched before it is not cached
+        self._sql_sources_generation = 0
 
     def _create_client(self) -> Client:
         """Create the underlying client instance."""
+        # All API calls go through one pooled httpx client with keep-alive
+        httpx_args: Dict[str, Any] = {"limits": DEFAULT_HTTP_LIMITS}
+        if self.http2:
+            httpx_args["http2"] = True
         if self.access_token:
             client = AuthenticatedClient(
                 base_url=self.base_url,
                 token=self.access_token,
                 auth_header_name="Authorization",
                 prefix="Bearer",
+                httpx_args=httpx_args,
             )
         else:
-            client = Client(base_url=self.base_url)
+            client = Client(base_url=self.base_url, httpx_args=httpx_args)
 
         if self.session_id:
             client = client.with_cookies({"resink_session": self.session_id})
 
         return client
 
+    def _get_client(self) -> Client:
+        """
+        Get the generated client for a call on the running event loop.
+
+        Pooled connections belong to the loop that opened them. run_sync() starts
+        a new loop per call from plain sync code, so an owned pool is replaced
+        whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None and self._owns_httpx_client:
+                self._client = self._create_client()
+            self._loop = loop
+        return self._client
+
     async def list_tasks(self, **kwargs) -> Dict[str, Any]:
         """List tasks with optional filtering."""
-        result = await list_resinkit_tasks.asyncio(client=self._client, **kwargs)
+        result = await list_resinkit_tasks.asyncio(client=self._get_client(), **kwargs)
         return result or {}
 
-    async def submit_task(self, task_config: Dict[str, Any]) -> Dict[str, Any]:
+    async def submit_task(
+        self, task_config: Union[Dict[str, Any], SubmitResinkitTaskPayload]
+    ) -> Dict[str, Any]:
         """Submit a new task with JSON configuration."""
-        payload = SubmitResinkitTaskPayload.from_dict(task_config)
-        result = await submit_resinkit_task.asyncio(client=self._client, body=payload)
+        payload = _as_model(SubmitResinkitTaskPayload, task_config)
+        result = await submit_resinkit_task.asyncio(
+            client=self._get_client(), body=payload
+        )
         return result or {}
 
     async def submit_yaml_task(self, yaml_config: str) -> Dict[str, Any]:
         """Submit a new task with YAML configuration."""
-        client_with_headers = self._client.with_headers({"Content-Type": "text/plain"})
-
-        async with client_with_headers.get_async_httpx_client() as httpx_client:
-            response = await httpx_client.post(
-                "/api/v1/agent/tasks/yaml", content=yaml_config
-            )
-            response.raise_for_status()
-            return response.json()
+        httpx_client = self._get_client().get_async_httpx_client()
+        response = await httpx_client.post(
+            "/api/v1/agent/tasks/yaml",
+            content=yaml_config,
+            headers={"Content-Type": "text/plain"},
+        )
+        response.raise_for_status()
+        return response.json()
 
     async def get_task_details(self, task_id: str) -> Dict[str, Any]:
         """Get details of a specific task."""
         result = await get_resinkit_task_details.asyncio(
-            task_id=task_id, client=self._client
+            task_id=task_id, client=self._get_client()
         )
         return result or {}
 
     async def cancel_task(
         self, task_id: str, reason: Optional[str] = None, force: bool = False
     ) -> Dict[str, Any]:
-        """Cancel a task."""
+        """Cancel a task. The cancel endpoint takes no reason, so ``reason`` is unused."""
+        _ = reason
         result = await cancel_resinkit_task.asyncio(
-            task_id=task_id, client=self._client, reason=reason, force=force
+            task_id=task_id, client=self._get_client(), force=force
         )
         return result or {}
 
     async def get_task_logs(self, task_id: str, **kwargs) -> List[LogEntry]:
         """Get logs for a specific task."""
         result = await get_resinkit_task_logs.asyncio(
-            task_id=task_id, client=self._client, **kwargs
+            task_id=task_id, client=self._get_client(), **kwargs
         )
-        if result and isinstance(result, list):
-            return [
-                LogEntry.from_dict(log) if isinstance(log, dict) else log
-                for log in result
-            ]
-        return []
+        # The generated endpoint already parses each entry into a LogEntry
+        return result if isinstance(result, list) else []
 
     async def get_task_results(self, task_id: str) -> Optional[TaskResult]:
         """Get results of a completed task."""
         result = await get_resinkit_task_results.asyncio(
-            task_id=task_id, client=self._client
+            task_id=task_id, client=self._get_client()
         )
         return result
 
+    async def get_many_task_details(self, task_ids: List[str]) -> List[Dict[str, Any]]:
+        """Get details of several tasks concurrently, in the order given."""
+        return await gather_bounded(
+            (self.get_task_details(task_id) for task_id in task_ids),
+            self.max_concurrent_requests,
+        )
+
+    async def get_many_task_logs(
+        self, task_ids: List[str], **kwargs
+    ) -> List[List[LogEntry]]:
+        """Get logs of several tasks concurrently, in the order given."""
+        return await gather_bounded(
+            (self.get_task_logs(task_id, **kwargs) for task_id in task_ids),
+            self.max_concurrent_requests,
+        )
+
+    async def get_many_task_results(
+        self, task_ids: List[str]
+    ) -> List[Optional[TaskResult]]:
+        """Get results of several tasks concurrently, in the order given."""
+        return await gather_bounded(
+            (self.get_task_results(task_id) for task_id in task_ids),
+            self.max_concurrent_requests,
+        )
+
     async def permanently_delete_task(self, task_id: str) -> Dict[str, Any]:
         """Permanently delete a task and its events if the task is in an end state."""
         result = await delete_resinkit_task_permanent.asyncio(
-            task_id=task_id, client=self._client
+            task_id=task_id, client=self._get_client()
         )
         return result or {"message": "Task deleted permanently."}
 
+    async def cancel_many_tasks(
+        self, task_ids: List[str], force: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Cancel several tasks concurrently; failures are returned in place."""
+        return await gather_bounded(
+            (self.cancel_task(task_id, force=force) for task_id in task_ids),
+            self.max_concurrent_requests,
+            return_exceptions=True,
+        )
+
+    async def delete_many_tasks(
+        self, task_ids: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Permanently delete several tasks concurrently; failures are returned in place."""
+        return await gather_bounded(
+            (self.permanently_delete_task(task_id) for task_id in task_ids),
+            self.max_concurrent_requests,
+            return_exceptions=True,
+        )
+
     async def list_variables(self) -> List[VariableResponse]:
         """List all variables."""
-        result = await list_variables.asyncio(client=self._client)
+        result = await list_variables.asyncio(client=self._get_client())
         return result or []
 
     async def get_variable(self, name: str) -> Optional[VariableResponse]:
         """Get a specific variable including its value."""
-        result = await get_variable.asyncio(name=name, client=self._client)
+        result = await get_variable.asyncio(name=name, client=self._get_client())
         return result
 
     async def create_variable(
@@ -183,70 +295,117 @@ class ResinkitAPIClient:
     ) -> Optional[VariableResponse]:
         """Create a new variable."""
         variable_data = VariableCreate(name=name, value=value, description=description)
-        result = await create_variable.asyncio(client=self._client, body=variable_data)
+        result = await create_variable.asyncio(
+            client=self._get_client(), body=variable_data
+        )
         return result
 
     async def delete_variable(self, name: str) -> Dict[str, Any]:
         """Delete a variable."""
-        result = await delete_variable.asyncio(name=name, client=self._client)
+        result = await delete_variable.asyncio(name=name, client=self._get_client())
         return result or {"message": f"Variable '{name}' deleted successfully."}
 
+    async def delete_many_variables(
+        self, names: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Delete several variables concurrently; failures are returned in place."""
+        return await gather_bounded(
+            (self.delete_variable(name) for name in names),
+            self.max_concurrent_requests,
+            return_exceptions=True,
+        )
+
     # SQL Sources methods
     async def list_sql_sources(self) -> List[SqlSourceResponse]:
-        """List all SQL sources."""
-        result = await list_sql_sources.asyncio(client=self._client)
-        return result or []
+        """List all SQL sources, reusing a recent result within the cache TTL."""
+        if self._sql_sources_cache is not None:
+            cached_at, sources = self._sql_sources_cache
+            if time.monotonic() - cached_at < self.sql_sources_cache_ttl:
+                return list(sources)
+
+        generation = self._sql_sources_generation
+        result = await list_sql_sources.asyncio(client=self._get_client())
+        if result is None:
+            return []
+        if (
+            self.sql_sources_cache_ttl > 0
+            and generation == self._sql_sources_generation
+        ):
+            self._sql_sources_cache = (time.monotonic(), result)
+        return list(result)
+
+    def invalidate_sql_sources_cache(self) -> None:
+        """Drop the cached list_sql_sources result so the next call hits the API."""
+        self._sql_sources_cache = None
+        self._sql_sources_generation += 1
 
     async def get_sql_source(self, source_name: str) -> Optional[SqlSourceResponse]:
         """Get a specific SQL source."""
         result = await get_sql_source.asyncio(
-            source_name=source_name, client=self._client
+            source_name=source_name, client=self._get_client()
         )
         return result
 
     async def create_sql_source(
-        self, source_data: Dict[str, Any]
+        self, source_data: Union[Dict[str, Any], SqlSourceCreate]
     ) -> Optional[SqlSourceResponse]:
         """Create a new SQL source."""
-        sql_source = SqlSourceCreate.from_dict(source_data)
-        result = await create_sql_source.asyncio(client=self._client, body=sql_source)
+        sql_source = _as_model(SqlSourceCreate, source_data)
+        result = await create_sql_source.asyncio(
+            client=self._get_client(), body=sql_source
+        )
+        self.invalidate_sql_sources_cache()
         return result
 
     async def update_sql_source(
-        self, source_name: str, source_data: Dict[str, Any]
+        self, source_name: str, source_data: Union[Dict[str, Any], SqlSourceUpdate]
     ) -> Optional[SqlSourceResponse]:
         """Update an existing SQL source."""
-        sql_source = SqlSourceUpdate.from_dict(source_data)
+        sql_source = _as_model(SqlSourceUpdate, source_data)
         result = await update_sql_source.asyncio(
-            source_name=source_name, client=self._client, body=sql_source
+            source_name=source_name, client=self._get_client(), body=sql_source
         )
+        self.invalidate_sql_sources_cache()
         return result
 
     async def delete_sql_source(self, source_name: str) -> Dict[str, Any]:
         """Delete a SQL source."""
         result = await delete_sql_source.asyncio(
-            source_name=source_name, client=self._client
+            source_name=source_name, client=self._get_client()
         )
+        self.invalidate_sql_sources_cache()
         return result or {
             "message": f"SQL source '{source_name}' deleted successfully."
         }
 
+    async def delete_many_sql_sources(
+        self, source_names: List[str]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Delete several SQL sources concurrently; failures are returned in place."""
+        return await gather_bounded(
+            (self.delete_sql_source(name) for name in source_names),
+            self.max_concurrent_requests,
+            return_exceptions=True,
+        )
+
     async def crawl_database_tables(
-        self, crawl_request: Dict[str, Any]
+        self, crawl_request: Union[Dict[str, Any], DbCrawlRequest]
     ) -> Optional[DbCrawlResult]:
         """Crawl database tables for a SQL source."""
-        crawl_req = DbCrawlRequest.from_dict(crawl_request)
+        crawl_req = _as_model(DbCrawlRequest, crawl_request)
         result = await crawl_database_tables.asyncio(
-            client=self._client, body=crawl_req
+            client=self._get_client(), body=crawl_req
         )
         return result
 
     async def test_sql_connection(
-        self, source_data: Dict[str, Any]
+        self, source_data: Union[Dict[str, Any], SqlSourceCreate]
     ) -> Optional[SqlConnectionTestResult]:
         """Test SQL database connection without persisting credentials."""
-        sql_source = SqlSourceCreate.from_dict(source_data)
-        result = await test_sql_connection.asyncio(client=self._client, body=sql_source)
+        sql_source = _as_model(SqlSourceCreate, source_data)
+        result = await test_sql_connection.asyncio(
+            client=self._get_client(), body=sql_source
+        )
         return result
 
     async def execute_sql_query(
@@ -257,7 +416,7 @@ class ResinkitAPIClient:
             query=query, source_name=source_name, limit=limit
         )
         result = await execute_sql_query.asyncio(
-            client=self._client, body=query_request
+            client=self._get_client(), body=query_request
         )
         return result
 
@@ -265,7 +424,7 @@ class ResinkitAPIClient:
     async def list_sql_databases(self, source_name: str) -> List[DatabaseInfo]:
         """List databases in a SQL data source."""
         result = await list_sql_databases.asyncio(
-            source_name=source_name, client=self._client
+            source_name=source_name, client=self._get_client()
         )
         return result or []
 
@@ -274,7 +433,9 @@ class ResinkitAPIClient:
     ) -> List[SchemaInfo]:
         """List schemas in a database."""
         result = await list_sql_schemas.asyncio(
-            source_name=source_name, database_name=database_name, client=self._client
+            source_name=source_name,
+            database_name=database_name,
+            client=self._get_client(),
         )
         return result or []
 
@@ -283,7 +444,7 @@ class ResinkitAPIClient:
     ) -> List[TableInfo]:
         """List tables in a schema."""
         result = await list_sql_tables.asyncio(
-            source_name=source_name, schema_name=schema_name, client=self._client
+            source_name=source_name, schema_name=schema_name, client=self._get_client()
         )
         return result or []
 
@@ -295,7 +456,7 @@ class ResinkitAPIClient:
             source_name=source_name,
             table_name=table_name,
             schema_name=schema_name,
-            client=self._client,
+            client=self._get_client(),
         )
         return result or []
 
@@ -308,11 +469,24 @@ class ResinkitAPIClient:
         _ = exc_type, exc_val, exc_tb  # Unused parameters
         pass
 
+    async def aclose(self) -> None:
+        """
+        Close the pooled HTTP connections held by this client.
+
+        An httpx_client passed in by the caller is shared and left open. The API
+        client stays usable: the next call opens a new connection pool.
+        """
+        if not self._owns_httpx_client:
+            return
+        await self._client.get_async_httpx_client().aclose()
+        self._client = self._create_client()
+        self._loop = None
+
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._client.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        _ = exc_type, exc_val, exc_tb  # Unused parameters
+        await self.aclose()
@@ -166,6 +166,8 @@ class ResinkitConfig(BaseModel):
     session_id: Optional[str] = None
     access_token: Optional[str] = None
     sql_gateway_url: Optional[str] = None
+    # Multiplex API calls over HTTP/2 (requires the h2 package: httpx[http2])
+    http2: bool = False
 
     # Local storage configuration
     local_storage_dir: str = ".rsk"
@@ -189,30 +191,33 @@ class Settings(BaseSettings):
     sub_model: Optional[SubModel] = None
 
     # ResinKit configuration
-    resinkit: ResinkitConfig = ResinkitConfig()
+    resinkit: ResinkitConfig = Field(default_factory=ResinkitConfig)
 
     # AI configuration
-    llm_config: LLMConfig = LLMConfig()
-    embedding_config: EmbeddingConfig = EmbeddingConfig()
-    knowledge_base_config: KnowledgeBaseConfig = KnowledgeBaseConfig()
-    mcp_manager_config: MCPManagerConfig = MCPManagerConfig()
-    agents_config: AgentsConfig = AgentsConfig()
+    llm_config: LLMConfig = Field(default_factory=LLMConfig)
+    embedding_config: EmbeddingConfig = Field(default_factory=EmbeddingConfig)
+    knowledge_base_config: KnowledgeBaseConfig = Field(
+        default_factory=KnowledgeBaseConfig
+    )
+    mcp_manager_config: MCPManagerConfig = Field(default_factory=MCPManagerConfig)
+    agents_config: AgentsConfig = Field(default_factory=AgentsConfig)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Override with environment variables if they exist
-        if os.getenv("RESINKIT_BASE_URL"):
-            self.resinkit.base_url = os.getenv("RESINKIT_BASE_URL")
-        if os.getenv("RESINKIT_SESSION_ID"):
-            self.resinkit.session_id = os.getenv("RESINKIT_SESSION_ID")
-        if os.getenv("RESINKIT_ACCESS_TOKEN"):
-            self.resinkit.access_token = os.getenv("RESINKIT_ACCESS_TOKEN")
+        if base_url := os.getenv("RESINKIT_BASE_URL"):
+            self.resinkit.base_url = base_url
+        if session_id := os.getenv("RESINKIT_SESSION_ID"):
+            self.resinkit.session_id = session_id
+        if access_token := os.getenv("RESINKIT_ACCESS_TOKEN"):
+            self.resinkit.access_token = access_token
 
 
 _settings: Optional[Settings] = None
 
 
 def get_settings() -> Settings:
+    """Get the process-wide settings instance, creating it on first use."""
     global _settings
     if _settings is None:
         _settings = Settings()
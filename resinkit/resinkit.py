@@ -1,11 +1,8 @@
 from typing import Optional
 
+from resinkit.core.resinkit_api_client import ResinkitAPIClient
 from resinkit.core.settings import get_settings
 from resinkit.core.task import Task
-from resinkit.ui.sources_ui import SourcesUI
-from resinkit.ui.sql_task_ui import SQLTaskUI
-from resinkit.ui.tasks_management_ui import ResinkitAPIClient, TasksManagementUI
-from resinkit.ui.variables_ui import VariablesUI
 
 
 class Resinkit:
@@ -53,6 +50,8 @@ class Resinkit:
         Returns:
             A Panel UI component that can be displayed in a notebook.
         """
+        from resinkit.ui.variables_ui import VariablesUI
+
         self.ui_setup()
         ui = VariablesUI(
             base_url=self._base_url,
@@ -69,6 +68,8 @@ class Resinkit:
         Returns:
             A Panel UI component that can be displayed in a notebook.
         """
+        from resinkit.ui.tasks_management_ui import TasksManagementUI
+
         self.ui_setup()
         ui = TasksManagementUI(api_client=self.api_client)
         return ui.show()
@@ -92,6 +93,8 @@ class Resinkit:
         """
         Display a UI for submitting Flink SQL tasks.
         """
+        from resinkit.ui.sql_task_ui import SQLTaskUI
+
         self.ui_setup()
         ui = SQLTaskUI(api_client=self.api_client)
         return ui.show()
@@ -103,6 +106,8 @@ class Resinkit:
         Returns:
             A Panel UI component that can be displayed in a notebook.
         """
+        from resinkit.ui.sources_ui import SourcesUI
+
         self.ui_setup()
         ui = SourcesUI(
             base_url=self._base_url,
@@ -1,4 +1,3 @@
-import asyncio
 import csv
 import json
 from pathlib import Path
@@ -9,6 +8,7 @@ import panel as pn
 
 from resinkit_api_client.models.database_kind import DatabaseKind
 
+from ..core.async_utils import run_sync
 from ..core.resinkit_api_client import ResinkitAPIClient
 from ..core.settings import get_settings
 
@@ -39,44 +39,7 @@ class SourcesUI:
 
     def _run_async(self, coro):
         """Helper to run async code properly whether in notebook or not."""
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # If we're in a running loop, use nest_asyncio or create task
-            try:
-                import nest_asyncio
-
-                nest_asyncio.apply()
-                return asyncio.run(coro)
-            except ImportError:
-                # If nest_asyncio not available, use a thread
-                import concurrent.futures
-                import threading
-
-                result = [None]
-                exception = [None]
-
-                def run_in_thread():
-                    try:
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        result[0] = new_loop.run_until_complete(coro)
-                        new_loop.close()
-                    except Exception as e:
-                        exception[0] = e
-                    finally:
-                        asyncio.set_event_loop(loop)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-
-                if exception[0]:
-                    raise exception[0]
-                return result[0]
-        except RuntimeError:
-            # No event loop running, use asyncio.run
-            return asyncio.run(coro)
+        return run_sync(coro)
 
     def _create_table_components(self):
         """Create table-related components"""
@@ -244,6 +207,9 @@ class SourcesUI:
     def _refresh_sources(self, event=None):
         """Refresh the sources table"""
         self.notification.value = ""
+        if event is not None:
+            # Explicit refresh from the button should bypass the client-side cache
+            self.api_client.invalidate_sql_sources_cache()
         self.sources = self._load_sources()
 
         # Convert list of dictionaries to pandas DataFrame
@@ -402,21 +368,17 @@ class SourcesUI:
             return
 
         try:
+            source_names = list(self.selected_sources)
+            results = self._run_async(
+                self.api_client.delete_many_sql_sources(source_names)
+            )
 
-            async def delete_sources():
-                results = []
-                for source_name in self.selected_sources:
-                    try:
-                        result = await self.api_client.delete_sql_source(source_name)
-                        results.append((source_name, True))
-                    except Exception as e:
-                        results.append((source_name, False, str(e)))
-                return results
-
-            results = self._run_async(delete_sources())
-
-            deleted_count = sum(1 for r in results if r[1])
-            failed_sources = [r[0] for r in results if not r[1]]
+            failed_sources = [
+                name
+                for name, result in zip(source_names, results)
+                if isinstance(result, Exception)
+            ]
+            deleted_count = len(source_names) - len(failed_sources)
 
             if failed_sources:
                 self.notification.value = f"Deleted {deleted_count} source(s), failed: {', '.join(failed_sources)}"
@@ -1,9 +1,8 @@
-import asyncio
-
 import panel as pn
 import param
 import yaml
 
+from resinkit.core.async_utils import run_sync
 from resinkit.core.resinkit_api_client import ResinkitAPIClient
 
 
@@ -24,44 +23,7 @@ class SQLTaskUI(param.Parameterized):
 
     def _run_async(self, coro):
         """Helper to run async code properly whether in notebook or not."""
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # If we're in a running loop, use nest_asyncio or create task
-            try:
-                import nest_asyncio
-
-                nest_asyncio.apply()
-                return asyncio.run(coro)
-            except ImportError:
-                # If nest_asyncio not available, use a thread
-                import concurrent.futures
-                import threading
-
-                result = [None]
-                exception = [None]
-
-                def run_in_thread():
-                    try:
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        result[0] = new_loop.run_until_complete(coro)
-                        new_loop.close()
-                    except Exception as e:
-                        exception[0] = e
-                    finally:
-                        asyncio.set_event_loop(loop)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-
-                if exception[0]:
-                    raise exception[0]
-                return result[0]
-        except RuntimeError:
-            # No event loop running, use asyncio.run
-            return asyncio.run(coro)
+        return run_sync(coro)
 
     def _get_current_view(self):
         if self.current_view == "submit":
@@ -1,4 +1,3 @@
-import asyncio
 import datetime
 
 import pandas as pd
@@ -6,6 +5,7 @@ import panel as pn
 import param
 import yaml
 
+from resinkit.core.async_utils import run_sync
 from resinkit.core.resinkit_api_client import ResinkitAPIClient
 
 
@@ -27,44 +27,7 @@ class TasksManagementUI(param.Parameterized):
 
     def _run_async(self, coro):
         """Helper to run async code properly whether in notebook or not."""
-        try:
-            # Try to get the current event loop
-            loop = asyncio.get_running_loop()
-            # If we're in a running loop, use nest_asyncio or create task
-            try:
-                import nest_asyncio
-
-                nest_asyncio.apply()
-                return asyncio.run(coro)
-            except ImportError:
-                # If nest_asyncio not available, use a thread
-                import concurrent.futures
-                import threading
-
-                result = [None]
-                exception = [None]
-
-                def run_in_thread():
-                    try:
-                        new_loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(new_loop)
-                        result[0] = new_loop.run_until_complete(coro)
-                        new_loop.close()
-                    except Exception as e:
-                        exception[0] = e
-                    finally:
-                        asyncio.set_event_loop(loop)
-
-                thread = threading.Thread(target=run_in_thread)
-                thread.start()
-                thread.join()
-
-                if exception[0]:
-                    raise exception[0]
-                return result[0]
-        except RuntimeError:
-            # No event loop running, use asyncio.run
-            return asyncio.run(coro)
+        return run_sync(coro)
 
     def _get_current_view(self):
         if self.current_view == "task_list":
@@ -169,17 +132,15 @@ class TasksManagementUI(param.Parameterized):
             selected_tasks = self.tasks_table.value.iloc[selected_indices]
             task_ids = selected_tasks["task_id"].tolist()
 
-            async def cancel_tasks():
-                success_count = 0
-                for task_id in task_ids:
-                    try:
-                        result = await self.api_client.cancel_task(task_id, force=False)
-                        success_count += 1
-                    except Exception as e:
-                        self._show_error(f"Error cancelling task {task_id}: {str(e)}")
-                return success_count
-
-            success_count = self._run_async(cancel_tasks())
+            results = self._run_async(
+                self.api_client.cancel_many_tasks(task_ids, force=False)
+            )
+            success_count = 0
+            for task_id, result in zip(task_ids, results):
+                if isinstance(result, Exception):
+                    self._show_error(f"Error cancelling task {task_id}: {str(result)}")
+                else:
+                    success_count += 1
 
             self._show_info(
                 f"Successfully initiated cancellation for {success_count} out of {len(task_ids)} tasks."
@@ -199,17 +160,13 @@ class TasksManagementUI(param.Parameterized):
             selected_tasks = self.tasks_table.value.iloc[selected_indices]
             task_ids = selected_tasks["task_id"].tolist()
 
-            async def delete_tasks():
-                success_count = 0
-                for task_id in task_ids:
-                    try:
-                        result = await self.api_client.permanently_delete_task(task_id)
-                        success_count += 1
-                    except Exception as e:
-                        self._show_error(f"Error deleting task {task_id}: {str(e)}")
-                return success_count
-
-            success_count = self._run_async(delete_tasks())
+            results = self._run_async(self.api_client.delete_many_tasks(task_ids))
+            success_count = 0
+            for task_id, result in zip(task_ids, results):
+                if isinstance(result, Exception):
+                    self._show_error(f"Error deleting task {task_id}: {str(result)}")
+                else:
+                    success_count += 1
 
             self._show_info(
                 f"Successfully deleted {success_count} out of {len(task_ids)} tasks."
@@ -430,7 +387,8 @@ job:
             task = self._run_async(get_task())
 
             # Format the task info as markdown
-            task_info = f"""
+            task_info_parts = [
+                f"""
 ## {task.get('task_name', 'Task')} ({task.get('task_id')})
 
 **Status:** {task.get('status', 'Unknown')}  
@@ -442,13 +400,16 @@ job:
 
 **Description:** {task.get('description', 'No description')}  
 """
+            ]
             if task.get("progress"):
                 prog = task["progress"]
-                task_info += f"""
+                task_info_parts.append(
+                    f"""
 ### Progress
 **Progress:** {prog.get('percentage', 0)}%  
 **Current Step:** {prog.get('current_step_message', 'Unknown')}  
 """
+                )
 
             if task.get("error_info"):
                 err = task["error_info"]
@@ -456,16 +417,18 @@ job:
                 error_message = err.get("error") or err.get("message", "Unknown error")
                 error_code = err.get("code", "Unknown") if "code" in err else ""
                 error_timestamp = err.get("timestamp", "")
-                task_info += f"""
+                task_info_parts.append(
+                    f"""
 ### Error Information
 **Error:** {error_message}  
 """
+                )
                 if error_code:
-                    task_info += f"**Code:** {error_code}  \n"
+                    task_info_parts.append(f"**Code:** {error_code}  \n")
                 if error_timestamp:
-                    task_info += f"**Timestamp:** {error_timestamp}  \n"
+                    task_info_parts.append(f"**Timestamp:** {error_timestamp}  \n")
 
-            self.task_info_pane.object = task_info
+            self.task_info_pane.object = "".join(task_info_parts)
 
             # Get logs
             try:
@@ -552,8 +515,6 @@ job:
                 if "'result_type'" in error_msg:
                     # Try to make a direct API call and handle the raw response
                     try:
-                        import httpx
-
                         # Access the raw API response to see what we actually get
                         async def get_raw_results():
                             client = self.api_client._client
@@ -1,6 +1,10 @@
 import asyncio
+import uuid
+
+import pytest
 
 from resinkit.core.resinkit_api_client import ResinkitAPIClient
+from resinkit_api_client.models.sql_source_response import SqlSourceResponse
 from tests.e2e.e2e_base import E2eBase
 
 """
@@ -8,6 +12,9 @@ Run this test:
 
 $ ./e2e.sh test_list_tasks
 $ ./e2e.sh test_list_variables
+$ ./e2e.sh test_get_many_task_details_preserves_order
+$ ./e2e.sh test_delete_many_variables_returns_failures_in_place
+$ ./e2e.sh test_sql_sources_cache_hit_and_invalidation
 
 # OR
 $ pytest tests/e2e/test_api_client.py::TestAPIClient::test_list_tasks -v --capture=no --tb=short
@@ -174,6 +181,130 @@ class TestAPIClient(E2eBase):
         # Run the async test
         asyncio.run(run_test())
 
+    def test_get_many_task_details_preserves_order(self):
+        """Test that get_many_task_details returns one result per id, in order"""
+
+        async def run_test():
+            tasks = (await self.client.list_tasks(limit=5))["tasks"]
+            if not tasks:
+                pytest.skip("No tasks available to fetch details for")
+
+            # Reverse the listing order so a sorted response would be caught
+            task_ids = [task["task_id"] for task in tasks][::-1]
+            details = await self.client.get_many_task_details(task_ids)
+
+            assert len(details) == len(task_ids), "Should return one result per id"
+            assert (
+                [d["task_id"] for d in details] == task_ids
+            ), "Results should be in the order of the requested ids"
+            for task_id, detail in zip(task_ids, details):
+                assert (
+                    detail == await self.client.get_task_details(task_id)
+                ), "Bulk result should match a single get_task_details call"
+
+            print(f"✅ Fetched details of {len(task_ids)} tasks in order")
+
+        asyncio.run(run_test())
+
+    def test_delete_many_variables_returns_failures_in_place(self):
+        """Test that delete_many_variables returns failures in place"""
+        suffix = uuid.uuid4().hex[:8]
+        names = [f"e2e_bulk_{suffix}_{i}" for i in range(3)]
+        failing_name = f"e2e_bulk_{suffix}_fail"
+
+        async def run_test():
+            for name in names:
+                created = await self.client.create_variable(name, "value")
+                assert created is not None, f"Variable '{name}' should be created"
+
+            # Make one delete fail client-side to check it is reported in place
+            delete_variable = self.client.delete_variable
+
+            async def delete_or_fail(name):
+                if name == failing_name:
+                    raise RuntimeError(f"refusing to delete {name}")
+                return await delete_variable(name)
+
+            self.client.delete_variable = delete_or_fail
+            try:
+                results = await self.client.delete_many_variables(
+                    [names[0], failing_name, names[1], names[2]]
+                )
+            finally:
+                del self.client.delete_variable
+
+            assert len(results) == 4, "Should return one result per name"
+            assert (
+                isinstance(results[1], RuntimeError)
+            ), "The failed delete should be returned at its own position"
+            for i in (0, 2, 3):
+                assert isinstance(results[i], dict), "Other deletes should succeed"
+
+            remaining = {var.name for var in await self.client.list_variables()}
+            assert not remaining & set(names), "All variables should be deleted"
+
+            print(f"✅ Deleted {len(names)} variables with one failure in place")
+
+        try:
+            asyncio.run(run_test())
+        finally:
+            for name in names:
+                self.delete(f"/agent/variables/{name}")
+
+    def test_sql_sources_cache_hit_and_invalidation(self):
+        """Test that the list_sql_sources cache hits and is invalidated on writes"""
+        client = ResinkitAPIClient(base_url=self.BASE_URL, sql_sources_cache_ttl=300)
+        suffix = uuid.uuid4().hex[:8]
+        external_name = f"e2e_cache_{suffix}_external"
+        own_name = f"e2e_cache_{suffix}_own"
+
+        def source_data(name):
+            return {
+                "name": name,
+                "kind": "sqlite",
+                "host": "localhost",
+                "port": 0,
+                "database": f"/tmp/{name}.db",
+                "user": "e2e",
+                "password": "e2e",
+            }
+
+        async def source_names():
+            return {source.name for source in await client.list_sql_sources()}
+
+        async def run_test():
+            before = await source_names()
+
+            # Created behind the client's back: the cached list must not change
+            response = self.post("/agent/sql/sources", source_data(external_name))
+            if response.status_code != 201:
+                pytest.skip(f"Could not create a SQL source: {response.text}")
+            assert await source_names() == before, "Second list should hit the cache"
+
+            # Created through the client: the cache is invalidated
+            created = await client.create_sql_source(source_data(own_name))
+            if not isinstance(created, SqlSourceResponse):
+                pytest.skip(f"Could not create a SQL source: {created}")
+            names = await source_names()
+            assert (
+                {external_name, own_name} <= names
+            ), "Create should invalidate the cache"
+
+            # Deleted through the client: the cache is invalidated again
+            results = await client.delete_many_sql_sources([own_name, external_name])
+            assert all(isinstance(r, dict) for r in results), "Deletes should succeed"
+            assert (
+                not {external_name, own_name} & await source_names()
+            ), "Delete should invalidate the cache"
+
+            print("✅ list_sql_sources cache hit and invalidation verified")
+
+        try:
+            asyncio.run(run_test())
+        finally:
+            for name in (external_name, own_name):
+                self.delete(f"/agent/sql/sources/{name}")
+
     def teardown_method(self):
         """Cleanup after each test"""
         # No explicit cleanup needed as async context managers
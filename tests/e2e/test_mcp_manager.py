@@ -16,7 +16,7 @@ $ pytest tests/e2e/test_mcp_manager.py::TestMCPManager::test_stdio_connection -v
 import asyncio
 import logging
 import subprocess
-from typing import Dict, List
+from typing import Dict, List, Mapping
 
 import pytest
 
@@ -244,7 +244,7 @@ class TestMCPManager:
 
             # Test getting all tools
             all_tools = manager.get_all_tools()
-            assert isinstance(all_tools, dict)
+            assert isinstance(all_tools, Mapping)
             logger.info(
                 f"Total tools from all servers: {sum(len(tools) for tools in all_tools.values())}"
             )
@@ -336,3 +336,103 @@ class TestMCPManager:
         logger.info("✓ Manager configuration validation passed")
 
         logger.info("✓ All configuration validation tests passed")
+
+
+def _require_npx():
+    """Skip the calling test when npx is not available for stdio MCP servers."""
+    try:
+        result = subprocess.run(
+            ["npx", "--version"], capture_output=True, text=True, timeout=10
+        )
+        if result.returncode != 0:
+            pytest.skip("npx not available for stdio MCP test")
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        pytest.skip("npx not available for stdio MCP test")
+
+
+class TestMCPManagerConnectionLifecycle:
+    """Test connection reuse and teardown against stdio MCP servers."""
+
+    @pytest.mark.asyncio
+    async def test_connect_server_twice_reuses_connection(self):
+        """A second connect_server returns the live instance without a new session."""
+        _require_npx()
+        manager = MCPManager(
+            MCPManagerConfig(
+                servers={"everything": EVERYTHING_STDIO_MCP_CONFIG},
+                auto_connect=False,
+            )
+        )
+
+        try:
+            first = await manager.connect_server("everything")
+            second = await manager.connect_server("everything")
+            assert second is first
+            assert manager.get_toolsets() == [first]
+
+            # One session was opened, so one disconnect stops the server
+            await manager.disconnect_server("everything")
+            assert not manager.is_connected("everything")
+            assert not first.is_running
+        except ConnectionError as e:
+            pytest.skip(f"Stdio MCP server not available: {e}")
+        finally:
+            await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_reuses_cached_instance(self):
+        """connect -> disconnect -> connect on the same config works with one instance."""
+        _require_npx()
+        manager = MCPManager(
+            MCPManagerConfig(
+                servers={"everything": EVERYTHING_STDIO_MCP_CONFIG},
+                auto_connect=False,
+            )
+        )
+
+        try:
+            first = await manager.connect_server("everything")
+            tools = manager.get_server_tools("everything")
+            await manager.disconnect_server("everything")
+            assert manager.get_server_tools("everything") == []
+
+            second = await manager.connect_server("everything")
+            assert second is first
+            assert second.is_running
+            assert manager.is_connected("everything")
+
+            refreshed = await manager.list_tools_from_server("everything")
+            assert [t.name for t in refreshed] == [t.name for t in tools]
+        except ConnectionError as e:
+            pytest.skip(f"Stdio MCP server not available: {e}")
+        finally:
+            await manager.disconnect_all()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_all_after_connect_all(self, caplog):
+        """disconnect_all tears several stdio servers down without cancel-scope errors."""
+        _require_npx()
+        server_names = ["everything_1", "everything_2", "everything_3"]
+        manager = MCPManager(
+            MCPManagerConfig(
+                servers={
+                    name: EVERYTHING_STDIO_MCP_CONFIG.model_copy()
+                    for name in server_names
+                },
+                auto_connect=False,
+            )
+        )
+
+        results = await manager.connect_all()
+        if not all(results.values()):
+            await manager.disconnect_all()
+            pytest.skip(f"Stdio MCP servers not available: {results}")
+        assert manager.get_connected_servers() == server_names
+        servers = manager.get_toolsets()
+
+        with caplog.at_level(logging.WARNING, logger="resinkit.ai.utils.mcp_manager"):
+            await manager.disconnect_all()
+
+        assert manager.get_connected_servers() == []
+        assert "Error disconnecting" not in caplog.text
+        assert not any(server.is_running for server in servers)